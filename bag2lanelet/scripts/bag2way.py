@@ -38,6 +38,7 @@ def bag2pose(input_path, interval=[0.1, 10000.0]):
     type_map = {}
     for topic_type in reader.get_all_topics_and_types():
         type_map[topic_type.name] = topic_type.type
+    tf_msg_type = None
 
     pose_list = []
     is_initial_pose = True
@@ -46,8 +47,9 @@ def bag2pose(input_path, interval=[0.1, 10000.0]):
     while reader.has_next():
         (topic, data, stamp) = reader.read_next()
         if topic == "/tf":
-            msg_type = get_message(type_map[topic])
-            msg = deserialize_message(data, msg_type)
+            if tf_msg_type is None:
+                tf_msg_type = get_message(type_map[topic])
+            msg = deserialize_message(data, tf_msg_type)
             for transform in msg.transforms:
                 if transform.child_frame_id != "base_link":
                     continue
@@ -70,6 +72,7 @@ def bag2point_stamped(input_path, too_close, too_far):
     type_map = {}
     for topic_type in reader.get_all_topics_and_types():
         type_map[topic_type.name] = topic_type.type
+    tf_msg_type = None
 
     pose_list = []
     is_initial_pose = True
@@ -78,8 +81,9 @@ def bag2point_stamped(input_path, too_close, too_far):
     while reader.has_next():
         (topic, data, stamp) = reader.read_next()
         if topic == "/tf":
-            msg_type = get_message(type_map[topic])
-            msg = deserialize_message(data, msg_type)
+            if tf_msg_type is None:
+                tf_msg_type = get_message(type_map[topic])
+            msg = deserialize_message(data, tf_msg_type)
             for transform in msg.transforms:
                 if transform.child_frame_id != "base_link":
                     continue
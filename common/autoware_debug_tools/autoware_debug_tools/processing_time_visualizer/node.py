@@ -61,12 +61,11 @@ class ProcessingTimeVisualizer(Node):
             s = time.time()
             while True:
                 for topic_name, topic_types in self.get_topic_names_and_types():
-                    for topic_type in topic_types:
-                        if (
-                            topic_type == "tier4_debug_msgs/msg/ProcessingTimeTree"
-                            and topic_name not in topics
-                        ):
-                            topics.append(topic_name)
+                    if (
+                        "tier4_debug_msgs/msg/ProcessingTimeTree" in topic_types
+                        and topic_name not in topics
+                    ):
+                        topics.append(topic_name)
 
                 if time.time() - s > 1.0:
                     break
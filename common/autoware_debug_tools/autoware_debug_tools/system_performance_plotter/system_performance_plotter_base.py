@@ -48,12 +48,17 @@ class SystemPerformancePlotterBase:
         topic_type_list = {}
         for topic_type in reader.get_all_topics_and_types():
             topic_type_list[topic_type.name] = topic_type.type
+        msg_type_list = {
+            topic_name: get_message(topic_type)
+            for topic_name, topic_type in topic_type_list.items()
+            if self.check_topic(topic_name)
+        }
         while reader.has_next():
             topic_name, msg, stamp = reader.read_next()
             if not self.check_topic(topic_name):
                 continue
 
-            data = deserialize_message(msg, get_message(topic_type_list[topic_name]))
+            data = deserialize_message(msg, msg_type_list[topic_name])
 
             to_nanosec = 1e-9
             time_stamp = stamp * to_nanosec
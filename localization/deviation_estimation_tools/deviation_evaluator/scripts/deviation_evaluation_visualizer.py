@@ -18,12 +18,12 @@
 # cspell:words lowerbound
 
 from pathlib import Path
-from threading import Thread
 
 from bag_load_utils import BagFileEvaluator
 import numpy as np
 from plot_utils import plot_bag_compare
 import rclpy
+import rclpy.executors
 from rclpy.node import Node
 
 PARAMS = {
@@ -115,8 +115,10 @@ def main(args=None):
     rclpy.init(args=args)
     print("Loading rosbag. This may take a while...")
     node = DeviationEvaluationVisualizer()
-    spin_thread = Thread(target=rclpy.spin, args=(node,))
-    spin_thread.start()
+    try:
+        rclpy.spin(node)
+    except (KeyboardInterrupt, rclpy.executors.ExternalShutdownException):
+        node.destroy_node()
 
 
 if __name__ == "__main__":
@@ -125,13 +125,16 @@ class PerceptionReplayerCommon(Node):
         )
         ego_odom_topic = "/localization/kinematic_state"
         traffic_signals_topic = "/perception/traffic_light_recognition/traffic_signals"
-        topic_filter = StorageFilter(topics=[objects_topic, ego_odom_topic, traffic_signals_topic])
+        topics = [objects_topic, ego_odom_topic, traffic_signals_topic]
+        topic_filter = StorageFilter(topics=topics)
         reader.set_filter(topic_filter)
+        msg_type_map = {
+            topic: get_message(type_map[topic]) for topic in topics if topic in type_map
+        }
 
         while reader.has_next():
             (topic, data, stamp) = reader.read_next()
-            msg_type = get_message(type_map[topic])
-            msg = deserialize_message(data, msg_type)
+            msg = deserialize_message(data, msg_type_map[topic])
             if topic == objects_topic:
                 if not isinstance(msg, self.objects_pub.msg_type):
                     # convert old autoware_auto_perception_msgs to new autoware_perception_msgs
@@ -17,6 +17,7 @@
 
 import argparse
 from collections import deque
+import functools
 import os
 import sys
 
@@ -60,7 +61,7 @@ class ProcessingTimeSubscriber(Node):
         for topic, types in topic_list:
             if topic.endswith("processing_time_ms") and topic not in self.subscribed_topics:
                 self.create_subscription(
-                    Float64Stamped, topic, lambda msg, topic=topic: self.callback(msg, topic), 1
+                    Float64Stamped, topic, functools.partial(self.callback, topic=topic), 1
                 )
                 self.get_logger().info(f"Subscribed to {topic} | Type: {types}")
                 self.subscribed_topics.add(topic)